@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import fields
+from functools import lru_cache
 from types import UnionType
 from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
 
@@ -31,6 +32,16 @@ _CAMEL_TO_SNAKE: dict[str, str] = {
 
 _TYPE_HINTS: dict[str, Any] = get_type_hints(SimulationConfig)
 
+# Identical configs reach the engine far more often than they look: a
+# share link replays the same config on every visit, and a slider dragged
+# away and back lands on a value that was already run. The frontend's own
+# cache is per tab, so it cannot absorb either case.
+_PAYLOAD_CACHE_SIZE = 64
+# Monte Carlo costs ~100x a deterministic run and is what the fan and
+# tornado charts are drawn from, so a repeat config matters most here.
+# Fewer entries: each holds five percentile bands.
+_MC_PAYLOAD_CACHE_SIZE = 32
+
 
 def _validate_value(name: str, value: Any, annotation: Any) -> Any:  # noqa: C901
     """Validate and coerce a JSON value against a field annotation.
@@ -176,6 +187,10 @@ def config_to_dict(config: SimulationConfig) -> dict[str, Any]:
 def simulate_payload(config: SimulationConfig) -> dict[str, Any]:
     """Run the deterministic engine and serialize results for the wire.
 
+    Payloads are memoised per config. Each call gets fresh dicts; the
+    series are tuples shared with the cache, so no caller can alter what
+    the next one receives.
+
     Parameters
     ----------
     config : SimulationConfig
@@ -199,9 +214,26 @@ def simulate_payload(config: SimulationConfig) -> dict[str, Any]:
         payload = simulate_payload(make_config())
         payload["verdict"]["winner"] in ("buy", "rent")  # True
 
+    """
+    return _fresh(_simulate_payload_cached(config))
+
+
+def _fresh(payload: dict[str, Any]) -> dict[str, Any]:
+    """Copy every dict level of a payload; the leaves are immutable."""
+    return {k: _fresh(v) if isinstance(v, dict) else v for k, v in payload.items()}
+
+
+@lru_cache(maxsize=_PAYLOAD_CACHE_SIZE)
+def _simulate_payload_cached(config: SimulationConfig) -> dict[str, Any]:
+    """Build the deterministic payload for a (hashable, frozen) config.
+
+    Sequences are tuples: this dict is shared by every caller through
+    the cache and only ever leaves it via :func:`_fresh`.
     """
     results = calculate_scenarios(config)
-    df = results.data
+    # Read the engine's arrays directly; the DataFrame view is never needed
+    # on the wire.
+    cols = results.columns
     breakeven = results.breakeven_year
     return {
         "verdict": {
@@ -223,16 +255,16 @@ def simulate_payload(config: SimulationConfig) -> dict[str, Any]:
             "taxSavings": results.total_tax_savings,
         },
         "series": {
-            "year": df["Year"].tolist(),
-            "homeValue": df["Home_Value"].tolist(),
-            "equityValue": df["Equity_Value"].tolist(),
-            "buyPortfolioValue": df["Buy_Portfolio_Value"].tolist(),
-            "mortgageBalance": df["Mortgage_Balance"].tolist(),
-            "outflowBuy": df["Outflow_Buy"].tolist(),
-            "outflowRent": df["Outflow_Rent"].tolist(),
-            "cashCommitted": df["Cash_Committed"].tolist(),
-            "netBuy": df["Net_Buy"].tolist(),
-            "netRent": df["Net_Rent"].tolist(),
+            "year": tuple(cols["Year"].tolist()),
+            "homeValue": tuple(cols["Home_Value"].tolist()),
+            "equityValue": tuple(cols["Equity_Value"].tolist()),
+            "buyPortfolioValue": tuple(cols["Buy_Portfolio_Value"].tolist()),
+            "mortgageBalance": tuple(cols["Mortgage_Balance"].tolist()),
+            "outflowBuy": tuple(cols["Outflow_Buy"].tolist()),
+            "outflowRent": tuple(cols["Outflow_Rent"].tolist()),
+            "cashCommitted": tuple(cols["Cash_Committed"].tolist()),
+            "netBuy": tuple(cols["Net_Buy"].tolist()),
+            "netRent": tuple(cols["Net_Rent"].tolist()),
         },
     }
 
@@ -242,6 +274,10 @@ def monte_carlo_payload(
 ) -> dict[str, Any]:
     """Run Monte Carlo analysis and serialize results for the wire.
 
+    Seeded runs are deterministic and so memoised per config pair. As
+    with :func:`simulate_payload`, each call gets fresh dicts over
+    immutable tuples.
+
     Parameters
     ----------
     config : SimulationConfig
@@ -272,27 +308,49 @@ def monte_carlo_payload(
         0.0 <= payload["buyWinsPct"] <= 100.0  # True
 
     """
-    results = run_monte_carlo(config, mc_config or MonteCarloConfig())
+    mc_config = mc_config or MonteCarloConfig()
+    # An unseeded run is meant to differ every time; caching it would
+    # freeze the first draw.
+    if mc_config.seed is None:
+        return _monte_carlo_payload(config, mc_config)
+    return _fresh(_monte_carlo_payload_cached(config, mc_config))
+
+
+@lru_cache(maxsize=_MC_PAYLOAD_CACHE_SIZE)
+def _monte_carlo_payload_cached(
+    config: SimulationConfig, mc_config: MonteCarloConfig
+) -> dict[str, Any]:
+    """Build the seeded Monte Carlo payload for a (hashable) config pair."""
+    return _monte_carlo_payload(config, mc_config)
+
+
+def _monte_carlo_payload(
+    config: SimulationConfig, mc_config: MonteCarloConfig
+) -> dict[str, Any]:
+    """Run Monte Carlo analysis and build its payload, uncached."""
+    results = run_monte_carlo(config, mc_config)
     return {
         "buyWinsPct": float(results.buy_wins_pct),
         "medianDifference": float(results.median_difference),
         "p5Difference": float(results.p5_difference),
         "p95Difference": float(results.p95_difference),
-        "yearAxis": results.year_arr.tolist(),
-        "percentileLevels": results.percentile_levels,
-        "differencePercentiles": results.difference_percentiles.tolist(),
+        "yearAxis": tuple(results.year_arr.tolist()),
+        "percentileLevels": tuple(results.percentile_levels),
+        "differencePercentiles": tuple(
+            map(tuple, results.difference_percentiles.tolist())
+        ),
         "tornado": {
-            "params": results.sensitivity.params,
+            "params": tuple(results.sensitivity.params),
             # camelCase so the frontend can look each one up directly in
             # INPUT_DEFS and reuse that field's own formatter -- a rate
             # and a price render differently, and only the field knows
             # which it is.
-            "fields": [_camel(f) for f in results.sensitivity.fields],
-            "low": results.sensitivity.low.tolist(),
-            "high": results.sensitivity.high.tolist(),
-            "baseInput": results.sensitivity.base_input.tolist(),
-            "lowInput": results.sensitivity.low_input.tolist(),
-            "highInput": results.sensitivity.high_input.tolist(),
+            "fields": tuple(_camel(f) for f in results.sensitivity.fields),
+            "low": tuple(results.sensitivity.low.tolist()),
+            "high": tuple(results.sensitivity.high.tolist()),
+            "baseInput": tuple(results.sensitivity.base_input.tolist()),
+            "lowInput": tuple(results.sensitivity.low_input.tolist()),
+            "highInput": tuple(results.sensitivity.high_input.tolist()),
             "base": float(results.sensitivity.base),
         },
         "nSimulations": results.n_simulations,
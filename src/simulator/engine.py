@@ -5,8 +5,6 @@ two financial strategies: buying property vs. renting and investing.
 """
 
 import numpy as np
-import numpy_financial as npf
-import pandas as pd
 
 from .models import SimulationConfig, SimulationResults
 
@@ -73,6 +71,75 @@ def _is_close(a: float, b: float) -> bool:
     return abs(a - b) < _FLOAT_TOLERANCE
 
 
+def _monthly_payment(loan: float, r: float, n: int) -> float:
+    """Level monthly payment that amortizes ``loan`` over ``n`` months.
+
+    The closed-form annuity, arranged exactly as ``numpy_financial.pmt``
+    evaluates it so the result is bit-identical to the library call it
+    replaces -- without the array dispatch that library pays on scalars,
+    once per engine run.
+
+    Parameters
+    ----------
+    loan : float
+        Amount borrowed.
+    r : float
+        Monthly interest rate, decimal.
+    n : int
+        Amortization term in months.
+
+    Returns
+    -------
+    float
+        Positive monthly payment; ``loan / n`` at a zero rate.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from simulator.engine import _monthly_payment
+
+        _monthly_payment(90_000, 0.06 / 12, 360)  # 539.59...
+        _monthly_payment(90_000, 0.0, 360)        # 250.0
+
+    """
+    if _is_close_to_zero(r):
+        return loan / n
+    # np.power, not **: CPython's float pow and NumPy's disagree in the
+    # last bit often enough (~5% of inputs) to break bit-identity.
+    growth = float(np.power(1 + r, n))
+    return loan * growth / ((growth - 1) / r)
+
+
+def _growth_index(factors: np.ndarray) -> np.ndarray:
+    """Cumulative growth index along the last axis, 1.0 at month 0.
+
+    Parameters
+    ----------
+    factors : np.ndarray
+        Per-month growth factors ``1 + rate``, shape ``(..., H)``.
+
+    Returns
+    -------
+    np.ndarray
+        Shape ``(..., H+1)``: ``[1, f1, f1*f2, ...]`` for every leading
+        index.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import numpy as np
+        from simulator.engine import _growth_index
+
+        _growth_index(np.array([1.1, 1.1]))  # [1.0, 1.1, 1.21]
+
+    """
+    index = np.ones((*factors.shape[:-1], factors.shape[-1] + 1))
+    np.cumprod(factors, axis=-1, out=index[..., 1:])
+    return index
+
+
 def _net_value_series(
     config: SimulationConfig,
     prop_rate_monthly: np.ndarray,
@@ -96,18 +163,23 @@ def _net_value_series(
         simulation, including the Horizon (``horizon_years``).
     prop_rate_monthly : np.ndarray
         Monthly property appreciation rate per month, decimal, shape
-        ``(H,)`` for months 1..H.
+        ``(..., H)`` for months 1..H. Leading axes batch independent
+        paths: Monte Carlo passes ``(n_paths, H)`` and gets every path
+        back from one call.
     eq_rate_monthly : np.ndarray
-        Monthly equity portfolio growth rate per month, decimal, shape
-        ``(H,)``.
+        Monthly equity portfolio growth rate per month, decimal, same
+        shape as ``prop_rate_monthly``.
     rent_growth_monthly : np.ndarray
-        Monthly rent growth rate per month, decimal, shape ``(H,)``.
+        Monthly rent growth rate per month, decimal, same shape as
+        ``prop_rate_monthly``.
 
     Returns
     -------
     dict[str, np.ndarray]
-        Time series keyed by name, each of shape ``(H+1,)`` where
-        ``H = config.horizon_years * 12``: ``home_value``,
+        Time series keyed by name, each of shape ``(..., H+1)`` where
+        ``H = config.horizon_years * 12``. Series that depend on the
+        config alone (``mortgage_balance``, ``_interest``,
+        ``_insurance``) stay ``(H+1,)`` and broadcast. Keys: ``home_value``,
         ``mortgage_balance``, ``rent_portfolio``, ``buy_portfolio``,
         ``housing_cost_buy``, ``housing_cost_rent``, ``outflow_buy``,
         ``outflow_rent``, ``cash_committed``, ``cum_tax_savings``,
@@ -147,6 +219,11 @@ def _net_value_series(
     """
     h = config.horizon_years * 12
     t_arr = np.arange(h + 1)
+    # Leading batch axes, () for a single path. Every per-path series is
+    # laid out (*batch, months) so a cumsum/cumprod along the last axis is
+    # the same sequential scan per row as the 1-D call -- batching Monte
+    # Carlo through here is bit-identical to looping over its paths.
+    batch = prop_rate_monthly.shape[:-1]
 
     down_payment = config.property_price * (config.down_payment_pct / 100)
     # A transfer tax with a zero-rate band has a negative intercept (UK
@@ -164,18 +241,17 @@ def _net_value_series(
     n_term = config.mortgage_term_years * 12
 
     # --- Home value: compounds with the (possibly stochastic) monthly rate
-    home_growth = np.concatenate([[1.0], np.cumprod(1 + prop_rate_monthly)])
-    home_value = config.property_price * home_growth
+    home_value = config.property_price * _growth_index(1 + prop_rate_monthly)
 
     # --- Fixed-rate mortgage: payment over the term, not the horizon
     if _is_close_to_zero(loan):
         pmt = 0.0
         balance = np.zeros(h + 1)
     elif _is_close_to_zero(r):
-        pmt = loan / n_term
+        pmt = _monthly_payment(loan, r, n_term)
         balance = np.maximum(loan - pmt * t_arr, 0.0)
     else:
-        pmt = -npf.pmt(r, n_term, loan)
+        pmt = _monthly_payment(loan, r, n_term)
         growth = (1 + r) ** np.minimum(t_arr, n_term)
         balance = np.maximum(loan * growth - pmt * (growth - 1) / r, 0.0)
 
@@ -192,27 +268,25 @@ def _net_value_series(
     # No new region's levy base tracks market prices (FR valeur locative
     # cadastrale, DE Grundsteuerwert, UK 1991 bands), so the flat component
     # is cost-indexed rather than tied to the appreciating home value.
-    levy = np.zeros(h + 1)
-    levy[1:] = (
-        home_value[:-1] * (config.property_tax_rate / 100) / 12
+    levy = np.zeros(home_value.shape)
+    levy[..., 1:] = (
+        home_value[..., :-1] * (config.property_tax_rate / 100) / 12
         + (config.annual_property_levy / 12) * cost_index
     )
     insurance = np.zeros(h + 1)
     insurance[1:] = (config.annual_home_insurance / 12) * cost_index
-    maintenance = np.zeros(h + 1)
-    maintenance[1:] = (
-        home_value[:-1] * (config.annual_maintenance_pct / 100) / 12
+    maintenance = np.zeros(home_value.shape)
+    maintenance[..., 1:] = (
+        home_value[..., :-1] * (config.annual_maintenance_pct / 100) / 12
         + (config.annual_maintenance_amount / 12) * cost_index
     )
 
     housing_cost_buy = payment + levy + insurance + maintenance
 
     # --- Rent paid during month m (rent set at end of prior month)
-    rent_level = config.monthly_rent * np.concatenate(
-        [[1.0], np.cumprod(1 + rent_growth_monthly)]
-    )
-    housing_cost_rent = np.zeros(h + 1)
-    housing_cost_rent[1:] = rent_level[:-1]
+    rent_level = config.monthly_rent * _growth_index(1 + rent_growth_monthly)
+    housing_cost_rent = np.zeros(rent_level.shape)
+    housing_cost_rent[..., 1:] = rent_level[..., :-1]
 
     # Occupier-borne levies (UK council tax; DE umlagefaehige Grundsteuer)
     # are owed by whoever lives there, so the renter bears them too.
@@ -225,56 +299,68 @@ def _net_value_series(
         housing_cost_rent = housing_cost_rent + levy
 
     # --- Cash-flow matching: cheaper side invests the difference
-    surplus = housing_cost_buy - housing_cost_rent
-    contrib_rent = np.maximum(surplus, 0.0)
-    contrib_buy = np.maximum(-surplus, 0.0)
+    contrib_rent = housing_cost_buy - housing_cost_rent
+    contrib_buy = np.negative(contrib_rent)
+    np.maximum(contrib_rent, 0.0, out=contrib_rent)
+    np.maximum(contrib_buy, 0.0, out=contrib_buy)
 
     # Portfolio value with varying growth: V[t] = G[t]*(V0 + sum c[m]/G[m])
     # NL box 3 (Wet IB 2001 art. 5.25): taxed on min(deemed, actual)
     # return, floored at nil. Both operands are proportional to wealth,
     # so the min reduces to a rate comparison and the closed form
     # survives. Summed, not compounded: both callers -- this module's
-    # calculate_scenarios and monte_carlo._simulate_single_path -- feed
-    # an arithmetic annual/100/12, so twelve of them sum back to the
-    # annual draw exactly.
-    annual_return = eq_rate_monthly.reshape(config.horizon_years, 12).sum(axis=1)
+    # calculate_scenarios and monte_carlo._simulate_paths -- feed an
+    # arithmetic annual/100/12, so twelve of them sum back to the annual
+    # draw exactly.
+    annual_return = eq_rate_monthly.reshape(*batch, config.horizon_years, 12).sum(
+        axis=-1
+    )
     deemed = config.portfolio_deemed_return_pct / 100
     taxable = np.clip(np.minimum(deemed, annual_return), 0.0, None)
-    drag_monthly = np.repeat(taxable * (config.portfolio_drag_rate_pct / 100) / 12, 12)
-    eq_growth = np.concatenate([[1.0], np.cumprod(1 + eq_rate_monthly - drag_monthly)])
-    rent_portfolio = eq_growth * (initial_outlay + np.cumsum(contrib_rent / eq_growth))
-    buy_portfolio = eq_growth * np.cumsum(contrib_buy / eq_growth)
-    basis_rent = initial_outlay + np.cumsum(contrib_rent)
-    basis_buy = np.cumsum(contrib_buy)
+    drag_monthly = np.repeat(
+        taxable * (config.portfolio_drag_rate_pct / 100) / 12, 12, axis=-1
+    )
+    eq_growth = _growth_index(1 + eq_rate_monthly - drag_monthly)
+    rent_portfolio = eq_growth * (
+        initial_outlay + np.cumsum(contrib_rent / eq_growth, axis=-1)
+    )
+    buy_portfolio = eq_growth * np.cumsum(contrib_buy / eq_growth, axis=-1)
+    basis_rent = initial_outlay + np.cumsum(contrib_rent, axis=-1)
+    basis_buy = np.cumsum(contrib_buy, axis=-1)
 
     # --- Cash committed: identical for both strategies by construction
     cash_committed = initial_outlay + np.cumsum(
-        np.maximum(housing_cost_buy, housing_cost_rent)
+        np.maximum(housing_cost_buy, housing_cost_rent), axis=-1
     )
-    outflow_buy = initial_outlay + np.cumsum(housing_cost_buy)
-    outflow_rent = np.cumsum(housing_cost_rent)
+    outflow_buy = initial_outlay + np.cumsum(housing_cost_buy, axis=-1)
+    outflow_rent = np.cumsum(housing_cost_rent, axis=-1)
 
     # --- Deduction savings: (interest + capped levy) * marginal rate,
     # credited at the end of each completed year
-    cum_tax_savings = np.zeros(h + 1)
+    cum_tax_savings = np.zeros(levy.shape)
     if (
         config.interest_deduction_enabled
         and config.marginal_tax_rate_pct > _FLOAT_TOLERANCE
     ):
         yearly_interest = interest[1:].reshape(config.horizon_years, 12).sum(axis=1)
-        yearly_levy = levy[1:].reshape(config.horizon_years, 12).sum(axis=1)
+        yearly_levy = (
+            levy[..., 1:].reshape(*batch, config.horizon_years, 12).sum(axis=-1)
+        )
         if config.levy_deduction_cap is not None:
             yearly_levy = np.minimum(yearly_levy, config.levy_deduction_cap)
         yearly_savings = (yearly_interest + yearly_levy) * (
             config.marginal_tax_rate_pct / 100
         )
-        cum_by_year = np.concatenate([[0.0], np.cumsum(yearly_savings)])
-        cum_tax_savings = cum_by_year[t_arr // 12]
+        # Running total with a leading zero for year 0, scanned straight
+        # into its slot (same idiom as _growth_index).
+        cum_by_year = np.zeros((*batch, config.horizon_years + 1))
+        np.cumsum(yearly_savings, axis=-1, out=cum_by_year[..., 1:])
+        cum_tax_savings = cum_by_year[..., t_arr // 12]
 
     # --- Sale capital gains: regime-dependent taxable gain (ADR-0007)
     home_gain = np.maximum(home_value - config.property_price, 0.0)
     if config.sale_cg_regime == "fully_exempt":
-        taxable_gain = np.zeros(h + 1)
+        taxable_gain = np.zeros(home_gain.shape)
     elif config.sale_cg_regime == "exempt_amount":
         taxable_gain = np.maximum(home_gain - config.sale_cg_exempt_amount, 0.0)
     else:  # exempt_after_years: taxed only if sold before the holding period
@@ -363,40 +449,78 @@ def _find_breakeven(
         breakeven = _find_breakeven(years, net_buy, net_rent)
 
     """
-    # Calculate the difference (positive when buy is winning)
-    diff = net_buy - net_rent
+    # Positive when buy is winning
+    return _breakeven_from_diff(years, net_buy - net_rent)
 
-    # Find where diff crosses zero (changes sign)
-    # Skip the first point if it's effectively zero, to handle initial equality
-    start_idx = 1 if _is_close_to_zero(diff[0]) else 0
 
-    # Look for sign changes in the difference
-    for i in range(start_idx, len(diff) - 1):
-        # Check if diff crosses zero between i and i+1 using tolerance
-        if diff[i] * diff[i + 1] < -_FLOAT_TOLERANCE:
-            # Found a crossover: interpolate to find exact zero crossing
-            x1, x2 = years[i], years[i + 1]
-            y1, y2 = diff[i], diff[i + 1]
+def _breakeven_from_diff(years: np.ndarray, diff: np.ndarray) -> float | None:
+    """Find the year where ``diff`` (Buy minus Rent) first crosses zero.
+
+    The body of :func:`_find_breakeven`, taking the difference directly so
+    :func:`calculate_scenarios` can pass the ``Net_Difference`` column it
+    already holds.
+
+    Parameters
+    ----------
+    years : np.ndarray
+        Array of year values.
+    diff : np.ndarray
+        Net Value difference, Buy minus Rent, aligned with ``years``.
+
+    Returns
+    -------
+    float | None
+        Year of breakeven point, or None if no crossover occurs.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import numpy as np
+        from simulator.engine import _breakeven_from_diff
+
+        years = np.arange(4, dtype=float)
+        _breakeven_from_diff(years, np.array([-2.0, -1.0, 1.0, 3.0]))  # 1.5
+
+    """
+    if len(diff) < 2:
+        return None
+
+    # Both tests run over every interval at once; the first index to
+    # pass either one wins, and at the same index a crossing outranks an
+    # exact match -- the order a left-to-right scan would see them in.
+    # Sign change between i and i+1, using tolerance
+    crosses = diff[:-1] * diff[1:] < -_FLOAT_TOLERANCE
+    # Exact match at i (within tolerance); never at the first point
+    touches = np.abs(diff[:-1]) < _FLOAT_TOLERANCE
+    touches[0] = False
+    hits = crosses | touches
+    # Skip the first point if it's effectively zero, to handle initial equality
+    if _is_close_to_zero(diff[0]):
+        hits[0] = False
 
-            if not _is_close(y1, y2):
-                breakeven = x1 - y1 * (x2 - x1) / (y2 - y1)
-                return float(breakeven)
-            else:
-                # Both are zero (shouldn't happen with < 0 check, but handle it)
-                return float(x1)
-        elif _is_close_to_zero(diff[i]) and i > 0:
-            # Exact match at this point (within tolerance)
-            return float(years[i])
+    found = np.flatnonzero(hits)
+    if found.size == 0:
+        return None
+    i = found[0]
+    if not crosses[i]:
+        return float(years[i])
 
-    return None
+    # Found a crossover: interpolate to find exact zero crossing
+    x1, x2 = years[i], years[i + 1]
+    y1, y2 = diff[i], diff[i + 1]
+    if _is_close(y1, y2):
+        # Both are zero (shouldn't happen with < 0 check, but handle it)
+        return float(x1)
+    return float(x1 - y1 * (x2 - x1) / (y2 - y1))
 
 
 def calculate_scenarios(config: SimulationConfig) -> SimulationResults:
     """Run the deterministic simulation on the shared Net Value core.
 
     Feeds constant monthly rates (derived from the config's annual
-    rates) into :func:`_net_value_series` and assembles the results
-    DataFrame and summary fields. The Verdict (``final_difference``),
+    rates) into :func:`_net_value_series` and assembles the result
+    columns and summary fields. The Verdict (``final_difference``),
     the charted series (``results.data``), and the Breakeven all read
     the same ``net_buy``/``net_rent`` arrays, so they can never
     disagree (CONTEXT.md: "Net Value", "Verdict", "Breakeven").
@@ -445,29 +569,31 @@ def calculate_scenarios(config: SimulationConfig) -> SimulationResults:
 
     t_arr = np.arange(h + 1)
     year_arr = t_arr / 12
-    df = pd.DataFrame(
-        {
-            "Month": t_arr,
-            "Year": year_arr,
-            "Home_Value": series["home_value"],
-            "Equity_Value": series["rent_portfolio"],
-            "Buy_Portfolio_Value": series["buy_portfolio"],
-            "Mortgage_Balance": series["mortgage_balance"],
-            "Outflow_Buy": series["outflow_buy"],
-            "Outflow_Rent": series["outflow_rent"],
-            "Cash_Committed": series["cash_committed"],
-            "Net_Buy": series["net_buy"],
-            "Net_Rent": series["net_rent"],
-        }
-    )
-
     net_buy, net_rent = series["net_buy"], series["net_rent"]
+    # Buy - Rent at every month, subtracted once: the Verdict is its last
+    # point and the Breakeven is its first zero crossing.
+    net_difference = net_buy - net_rent
+    columns = {
+        "Month": t_arr,
+        "Year": year_arr,
+        "Home_Value": series["home_value"],
+        "Equity_Value": series["rent_portfolio"],
+        "Buy_Portfolio_Value": series["buy_portfolio"],
+        "Mortgage_Balance": series["mortgage_balance"],
+        "Outflow_Buy": series["outflow_buy"],
+        "Outflow_Rent": series["outflow_rent"],
+        "Cash_Committed": series["cash_committed"],
+        "Net_Buy": series["net_buy"],
+        "Net_Rent": series["net_rent"],
+        "Net_Difference": net_difference,
+    }
+
     return SimulationResults(
-        data=df,
+        columns=columns,
         final_net_buy=float(net_buy[-1]),
         final_net_rent=float(net_rent[-1]),
-        final_difference=float(net_buy[-1] - net_rent[-1]),
-        breakeven_year=_find_breakeven(year_arr, net_buy, net_rent),
+        final_difference=float(net_difference[-1]),
+        breakeven_year=_breakeven_from_diff(year_arr, net_difference),
         monthly_mortgage_payment=float(series["_monthly_payment"][0]),
         monthly_cost_buy_year1=float(np.mean(series["housing_cost_buy"][1:13])),
         monthly_cost_rent_year1=float(np.mean(series["housing_cost_rent"][1:13])),
@@ -1,19 +1,25 @@
 """Data models for the simulation engine."""
 
 from dataclasses import dataclass
-from typing import Literal
+from functools import cached_property
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Capital gains treatment on the sale of the home at the end of the horizon.
 SaleCgRegime = Literal["exempt_amount", "exempt_after_years", "fully_exempt"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """Configuration parameters for the simulation.
 
+    Frozen, so a config is hashable and can key the API's payload caches
+    directly; derive variants with :func:`dataclasses.replace`.
+
     Parameters
     ----------
     horizon_years : int
@@ -399,10 +405,17 @@ class SimulationConfig:
 class SimulationResults:
     """Results from the simulation engine.
 
+    The time series are held as plain arrays. Most callers read only the
+    summary scalars -- the tornado runs the engine ~17 times per request
+    for ``final_difference`` alone -- so the DataFrame view is built on
+    first access to :attr:`data` rather than on every run.
+
     Parameters
     ----------
-    data : pd.DataFrame
-        DataFrame containing the per-month time-series columns.
+    columns : dict[str, np.ndarray]
+        Per-month time series keyed by column name (``"Year"``,
+        ``"Net_Buy"``, ``"Net_Difference"``, ...), each of shape
+        ``(H+1,)``.
     final_net_buy : float
         Final net value for the buying scenario.
     final_net_rent : float
@@ -438,19 +451,19 @@ class SimulationResults:
 
     .. code-block:: python
 
+        import numpy as np
         from simulator.models import SimulationResults
-        import pandas as pd
 
-        df = pd.DataFrame({
-            'Month': [0, 12, 24],
-            'Year': [0, 1, 2],
-            'Home_Value': [500000, 515000, 530450],
-            'Net_Buy': [400000, 397000, 394450],
-            'Net_Rent': [100000, 83000, 66490],
-        })
+        columns = {
+            'Month': np.array([0, 12, 24]),
+            'Year': np.array([0.0, 1.0, 2.0]),
+            'Home_Value': np.array([500000, 515000, 530450]),
+            'Net_Buy': np.array([400000, 397000, 394450]),
+            'Net_Rent': np.array([100000, 83000, 66490]),
+        }
 
         results = SimulationResults(
-            data=df,
+            columns=columns,
             final_net_buy=394450,
             final_net_rent=66490,
             final_difference=327960,
@@ -469,7 +482,7 @@ class SimulationResults:
 
     """
 
-    data: pd.DataFrame
+    columns: dict[str, np.ndarray]
     final_net_buy: float
     final_net_rent: float
     final_difference: float
@@ -485,8 +498,35 @@ class SimulationResults:
     total_mortgage_interest_paid: float
     total_tax_savings: float
 
+    @cached_property
+    def data(self) -> "pd.DataFrame":
+        """DataFrame view of :attr:`columns`, built once on first access.
 
-@dataclass
+        Returns
+        -------
+        pd.DataFrame
+            One row per month, one column per entry of ``columns``.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            from simulator.engine import calculate_scenarios
+            from tests.test_models import make_config
+
+            df = calculate_scenarios(make_config()).data
+            df[["Year", "Net_Buy", "Net_Rent"]].tail()
+
+        """
+        # Imported here, not at module level: pandas is a third of the
+        # server's cold import time, and nothing on the request path reads
+        # this view.
+        import pandas as pd
+
+        return pd.DataFrame(self.columns)
+
+
+@dataclass(frozen=True, slots=True)
 class MonteCarloConfig:
     """Configuration for Monte Carlo uncertainty analysis.
 
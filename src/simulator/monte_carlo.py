@@ -40,6 +40,12 @@ _LEVY_RELATIVE_DELTA = 0.5 / 1.2
 # relative) and far below any swing a user could read off the chart.
 _NEGLIGIBLE_SWING_RATIO = 1e-6
 
+# Paths per vectorised core call in run_monte_carlo. The core holds a few
+# dozen (paths, months) float64 intermediates at once; 100 paths at the
+# 100-year horizon keeps that near 30 MB while leaving only five Python
+# round-trips for the default 500 simulations.
+_PATH_BLOCK = 100
+
 # Fields whose tornado delta is an ANNUAL standard deviation.
 #
 # That sigma is what run_monte_carlo needs: it generates a fresh draw
@@ -255,14 +261,17 @@ def _generate_annual_draws(
     }
 
 
-def _simulate_single_path(
+def _simulate_paths(
     config: SimulationConfig,
     annual_prop_rates: np.ndarray,
     annual_equity_rates: np.ndarray,
     annual_rent_rates: np.ndarray,
 ) -> tuple[np.ndarray, np.ndarray]:
-    """Simulate one MC path by feeding stochastic monthly rates to the
-    shared engine core — no duplicated financial math (ADR-0001).
+    """Simulate a block of MC paths by feeding stochastic monthly rates to
+    the shared engine core — no duplicated financial math (ADR-0001).
+
+    The core broadcasts over leading axes, so the whole block is one
+    vectorised call rather than a Python loop over paths.
 
     Parameters
     ----------
@@ -271,28 +280,28 @@ def _simulate_single_path(
         closing costs, tax settings, etc.).
     annual_prop_rates : np.ndarray
         Property appreciation rate per year in percentage points.
-        Shape: ``(n_years,)``.
+        Shape: ``(n_paths, n_years)``.
     annual_equity_rates : np.ndarray
         Equity growth rate per year in percentage points.
-        Shape: ``(n_years,)``.
+        Shape: ``(n_paths, n_years)``.
     annual_rent_rates : np.ndarray
         Rent inflation rate per year in percentage points.
-        Shape: ``(n_years,)``.
+        Shape: ``(n_paths, n_years)``.
 
     Returns
     -------
     tuple[np.ndarray, np.ndarray]
         ``(net_buy, net_rent)`` liquidation-priced Net Value series,
-        each of shape ``(n_months + 1,)``.
+        each of shape ``(n_paths, n_months + 1)``.
 
     Examples
     --------
-    Simulate a single path with constant rates:
+    Simulate two paths with constant rates:
 
     .. code-block:: python
 
         import numpy as np
-        from simulator.monte_carlo import _simulate_single_path
+        from simulator.monte_carlo import _simulate_paths
         from simulator.models import SimulationConfig
 
         config = SimulationConfig(
@@ -301,16 +310,16 @@ def _simulate_single_path(
             property_appreciation_annual=3.0,
             equity_growth_annual=7.0, monthly_rent=2000,
         )
-        prop = np.full(10, 3.0)
-        eq = np.full(10, 7.0)
-        rent = np.full(10, 3.0)
-        net_buy, net_rent = _simulate_single_path(config, prop, eq, rent)
+        prop = np.full((2, 10), 3.0)
+        eq = np.full((2, 10), 7.0)
+        rent = np.full((2, 10), 3.0)
+        net_buy, net_rent = _simulate_paths(config, prop, eq, rent)
 
     """
     # Expand annual percentage draws to per-month decimal rates
-    prop_m = np.repeat(annual_prop_rates / 100 / 12, 12)
-    eq_m = np.repeat(annual_equity_rates / 100 / 12, 12)
-    rent_m = np.repeat(annual_rent_rates / 100 / 12, 12)
+    prop_m = np.repeat(annual_prop_rates / 100 / 12, 12, axis=-1)
+    eq_m = np.repeat(annual_equity_rates / 100 / 12, 12, axis=-1)
+    rent_m = np.repeat(annual_rent_rates / 100 / 12, 12, axis=-1)
     series = _net_value_series(config, prop_m, eq_m, rent_m)
     return series["net_buy"], series["net_rent"]
 
@@ -364,7 +373,7 @@ def _compute_sensitivity(  # noqa: C901
             print(f"{p}: [{lo:,.0f}, {hi:,.0f}]")
 
     """
-    from dataclasses import asdict
+    from dataclasses import replace
 
     from .engine import calculate_scenarios
 
@@ -372,10 +381,7 @@ def _compute_sensitivity(  # noqa: C901
         **overrides: float,
     ) -> float:
         """Run deterministic engine with parameter overrides."""
-        base_dict = asdict(base_config)
-        base_dict.update(overrides)
-        cfg = SimulationConfig(**base_dict)
-        res = calculate_scenarios(cfg)
+        res = calculate_scenarios(replace(base_config, **overrides))
         return res.final_difference
 
     # Base case
@@ -547,9 +553,10 @@ def run_monte_carlo(
 ) -> MonteCarloResults:
     """Run the full Monte Carlo uncertainty analysis.
 
-    Generates correlated annual rate draws, simulates each path,
-    collects results into 2D arrays, computes percentiles and summary
-    statistics, and runs OAT sensitivity analysis.
+    Generates correlated annual rate draws, simulates the paths in
+    vectorised blocks, collects results into 2D arrays, computes
+    percentiles and summary statistics, and runs OAT sensitivity
+    analysis.
 
     Parameters
     ----------
@@ -600,16 +607,15 @@ def run_monte_carlo(
     all_net_buy = np.zeros((n_sims, n_points))
     all_net_rent = np.zeros((n_sims, n_points))
 
-    # Simulate each path
-    for i in range(n_sims):
-        net_buy, net_rent = _simulate_single_path(
+    # Simulate the paths in blocks: one vectorised core call per block
+    for lo in range(0, n_sims, _PATH_BLOCK):
+        block = slice(lo, lo + _PATH_BLOCK)
+        all_net_buy[block], all_net_rent[block] = _simulate_paths(
             config=base_config,
-            annual_prop_rates=draws["property_appreciation"][i],
-            annual_equity_rates=draws["equity_growth"][i],
-            annual_rent_rates=draws["rent_inflation"][i],
+            annual_prop_rates=draws["property_appreciation"][block],
+            annual_equity_rates=draws["equity_growth"][block],
+            annual_rent_rates=draws["rent_inflation"][block],
         )
-        all_net_buy[i] = net_buy
-        all_net_rent[i] = net_rent
 
     # Chart data uses the same liquidation-priced series as summary stats
     all_diffs = all_net_buy - all_net_rent
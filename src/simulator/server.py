@@ -115,6 +115,8 @@ def monte_carlo(payload: Annotated[dict[str, Any], Body(...)]) -> dict[str, Any]
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     # Validate before acquiring so invalid requests never consume a compute
     # slot; then guard only the expensive run behind the concurrency cap.
+    # A memoised config still takes a slot (lru_cache has no lookup that
+    # does not also compute), but holds it only for the dict copy.
     if not _mc_semaphore.acquire(blocking=False):
         raise HTTPException(
             status_code=503,
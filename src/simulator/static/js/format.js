@@ -11,11 +11,14 @@ export const MINUS = "\u2212";
 // Currency is formatting only -- no FX, no conversion (ADR-0007). The
 // engine is currency-agnostic; this is the single place the symbol lives.
 let currencySymbol = "$";
-let currencyLocale = "en-US";
+// Built once per currency, not per value: Number.toLocaleString
+// constructs a fresh locale formatter on every call, and fmtMoney runs
+// for every table cell and hover label on each render.
+let groupedInteger = new Intl.NumberFormat("en-US");
 
 export function setCurrency(symbol, locale = "en-US") {
   currencySymbol = symbol;
-  currencyLocale = locale;
+  groupedInteger = new Intl.NumberFormat(locale);
 }
 
 export function getCurrencySymbol() {
@@ -24,7 +27,7 @@ export function getCurrencySymbol() {
 
 export function fmtMoney(v) {
   const sign = v < 0 ? MINUS : "";
-  return `${sign}${currencySymbol}${Math.round(Math.abs(v)).toLocaleString(currencyLocale)}`;
+  return `${sign}${currencySymbol}${groupedInteger.format(Math.round(Math.abs(v)))}`;
 }
 
 export function fmtCompact(v) {
@@ -47,13 +47,14 @@ const TABLE_COLUMNS = [
 
 function renderTable(series) {
   // Yearly rows for readability; CSV export (below) keeps every month.
-  const rows = series.year
-    .map((year, i) => ({ year, i }))
-    .filter(({ i }) => i % 12 === 0)
-    .map(({ i }) => `<tr>${TABLE_COLUMNS.map(([, key, fmt]) => `<td>${fmt(series[key][i])}</td>`).join("")}</tr>`)
-    .join("");
+  // Stride to each year-end month rather than materialising every month
+  // and filtering eleven in twelve back out.
+  const rows = [];
+  for (let i = 0; i < series.year.length; i += 12) {
+    rows.push(`<tr>${TABLE_COLUMNS.map(([, key, fmt]) => `<td>${fmt(series[key][i])}</td>`).join("")}</tr>`);
+  }
   document.getElementById("data-table").innerHTML =
-    `<table><thead><tr>${TABLE_COLUMNS.map(([label]) => `<th>${label}</th>`).join("")}</tr></thead><tbody>${rows}</tbody></table>`;
+    `<table><thead><tr>${TABLE_COLUMNS.map(([label]) => `<th>${label}</th>`).join("")}</tr></thead><tbody>${rows.join("")}</tbody></table>`;
 }
 
 export function downloadCsv(series) {
@@ -0,0 +1,14 @@
+"""Fixtures shared across test modules."""
+
+import pytest
+
+from simulator.models import SimulationConfig
+from simulator.monte_carlo import _compute_sensitivity
+from tests.test_us_regression import US_PRESET
+
+
+@pytest.fixture(scope="session")
+def us_sensitivity():
+    # The US tornado is pinned by both test_us_regression and
+    # test_monte_carlo; one base run plus two per bar, computed once.
+    return _compute_sensitivity(SimulationConfig(**US_PRESET))
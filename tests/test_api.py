@@ -1,8 +1,11 @@
-import itertools
 import json
+import os
 import re
+import subprocess
+import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
@@ -35,6 +38,24 @@ def test_health() -> None:
     assert response.json() == {"status": "ok"}
 
 
+def test_server_import_does_not_load_pandas() -> None:
+    # pandas backs only the lazy SimulationResults.data view; importing it
+    # at startup cost a third of the server's cold import time.
+    # pytest's pythonpath setting does not reach subprocesses, so hand the
+    # probe the same src/ tree explicitly (the version lookup in
+    # simulator/__init__.py still needs the package installed).
+    probe = "import sys, simulator.server; print('pandas' in sys.modules)"
+    src = Path(__file__).parent.parent / "src"
+    out = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(src)},
+    )
+    assert out.stdout.strip() == "False"
+
+
 def test_regions_endpoint() -> None:
     response = client.get("/api/regions")
     assert response.status_code == 200
@@ -123,16 +144,68 @@ def test_simulate_payload_matches_engine_truth() -> None:
     assert series["netRent"][-1] == results.final_net_rent
 
 
+def test_simulate_payload_is_memoised_per_config() -> None:
+    first = simulate_payload(make_config())
+    second = simulate_payload(make_config())
+    assert second == first
+    # Served from the cache: the same series objects, not a second run
+    assert second["series"]["netBuy"] is first["series"]["netBuy"]
+    other = simulate_payload(make_config(monthly_rent=2_500))
+    assert other["series"]["netBuy"] is not first["series"]["netBuy"]
+
+
+def test_mutating_a_simulate_payload_does_not_reach_the_cache() -> None:
+    payload = simulate_payload(make_config())
+    payload["verdict"]["winner"] = "x"
+    payload["series"]["netBuy"] = ()
+    with pytest.raises(TypeError):
+        payload["series"]["netRent"][-1] = 0.0
+
+    again = simulate_payload(make_config())
+    assert again["verdict"]["winner"] in ("buy", "rent")
+    assert len(again["series"]["netBuy"]) == len(again["series"]["netRent"])
+
+
 def test_simulate_payload_outflows_monotonic() -> None:
     series = simulate_payload(make_config())["series"]
     for key in ("outflowBuy", "outflowRent"):
         values = series[key]
-        assert all(b >= a for a, b in itertools.pairwise(values))
+        assert np.diff(values).min() >= 0
 
 
 def test_simulate_payload_is_json_serializable() -> None:
-    payload = simulate_payload(make_config())
-    assert json.loads(json.dumps(payload)) == payload
+    # Series are tuples, which decode as lists; a lossless round trip is
+    # a fixed point of dumps(loads(...)).
+    wire = json.dumps(simulate_payload(make_config()))
+    assert json.dumps(json.loads(wire)) == wire
+
+
+def test_seeded_monte_carlo_payload_is_memoised() -> None:
+    mc = MonteCarloConfig(n_simulations=20, seed=3)
+    first = monte_carlo_payload(make_config(), mc)
+    second = monte_carlo_payload(make_config(), mc)
+    assert second == first
+    assert second["differencePercentiles"] is first["differencePercentiles"]
+
+
+def test_mutating_a_monte_carlo_payload_does_not_reach_the_cache() -> None:
+    mc = MonteCarloConfig(n_simulations=20, seed=3)
+    payload = monte_carlo_payload(make_config(), mc)
+    payload["tornado"]["params"] = ()
+    payload["percentileLevels"] = ()
+    with pytest.raises(TypeError):
+        payload["differencePercentiles"][0][0] = 0.0
+
+    again = monte_carlo_payload(make_config(), mc)
+    assert len(again["tornado"]["params"]) == len(again["tornado"]["low"]) > 0
+    assert len(again["percentileLevels"]) == len(again["differencePercentiles"])
+
+
+def test_unseeded_monte_carlo_payload_is_never_memoised() -> None:
+    mc = MonteCarloConfig(n_simulations=20, seed=None)
+    first = monte_carlo_payload(make_config(), mc)
+    second = monte_carlo_payload(make_config(), mc)
+    assert second["differencePercentiles"] is not first["differencePercentiles"]
 
 
 def test_monte_carlo_payload_shape_and_determinism() -> None:
@@ -153,7 +226,8 @@ def test_monte_carlo_payload_shape_and_determinism() -> None:
     assert len(tornado["params"]) == len(tornado["low"]) == len(tornado["high"])
     assert isinstance(tornado["base"], float)
 
-    assert json.loads(json.dumps(first)) == first
+    wire = json.dumps(first)
+    assert json.dumps(json.loads(wire)) == wire
 
 
 def test_region_availability_matches_data_presence() -> None:
@@ -1,40 +1,42 @@
 """Tests for calculate_scenarios: assembly, verdict/chart consistency."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 import numpy as np
+import pytest
 
 from simulator.engine import calculate_scenarios
 from tests.test_models import make_config
 
 
+@pytest.fixture(scope="module")
+def res():
+    # The tests below only read from the results, so one engine run and
+    # one DataFrame build are shared across the module.
+    return calculate_scenarios(make_config())
+
+
 class TestConsistency:
-    def test_verdict_is_the_last_point_of_the_charted_series(self):
+    def test_verdict_is_the_last_point_of_the_charted_series(self, res):
         # THE regression test for the production bug: the headline,
         # the chart, and the breakeven all read the same series
-        res = calculate_scenarios(make_config())
         assert res.final_net_buy == res.data["Net_Buy"].iloc[-1]
         assert res.final_net_rent == res.data["Net_Rent"].iloc[-1]
         assert res.final_difference == res.final_net_buy - res.final_net_rent
+        assert res.final_difference == res.data["Net_Difference"].iloc[-1]
 
     def test_breakeven_sign_agrees_with_series(self):
         res = calculate_scenarios(make_config(horizon_years=30))
-        diff = res.data["Net_Buy"] - res.data["Net_Rent"]
+        diff = res.data["Net_Difference"].to_numpy()
         if res.breakeven_year is None:
             # No crossing => the sign never flips after t=0
-            signs = np.sign(diff.iloc[1:])
-            assert len(set(signs[np.abs(diff.iloc[1:]) > 1e-6])) <= 1
+            tail = diff[1:]
+            assert len(np.unique(np.sign(tail[np.abs(tail) > 1e-6]))) <= 1
         else:
             assert 0 < res.breakeven_year <= 30
 
 
 class TestAssembly:
-    def test_dataframe_shape_and_columns(self):
-        res = calculate_scenarios(make_config(horizon_years=10))
-        assert len(res.data) == 121  # H months + 1
+    def test_dataframe_shape_and_columns(self, res):
+        assert len(res.data) == 121  # 10-year default: H months + 1
         for col in [
             "Month",
             "Year",
@@ -47,17 +49,28 @@ class TestAssembly:
             "Cash_Committed",
             "Net_Buy",
             "Net_Rent",
+            "Net_Difference",
         ]:
             assert col in res.data.columns
 
-    def test_year1_monthly_costs(self):
-        res = calculate_scenarios(make_config())
+    def test_net_difference_is_buy_minus_rent(self, res):
+        cols = res.columns
+        np.testing.assert_array_equal(
+            cols["Net_Difference"], cols["Net_Buy"] - cols["Net_Rent"]
+        )
+
+    def test_dataframe_is_built_from_the_columns(self, res):
+        assert list(res.data.columns) == list(res.columns)
+        np.testing.assert_array_equal(
+            res.data["Net_Buy"].to_numpy(), res.columns["Net_Buy"]
+        )
+
+    def test_year1_monthly_costs(self, res):
         assert res.monthly_cost_rent_year1 > 0
         # Buyer cost must include levy+insurance+maintenance, not just PMT
         assert res.monthly_cost_buy_year1 > res.monthly_mortgage_payment
 
-    def test_cost_totals_positive(self):
-        res = calculate_scenarios(make_config())
+    def test_cost_totals_positive(self, res):
         assert res.total_closing_costs_buyer == 500_000 * 0.03
         assert res.total_property_tax_paid > 0
         assert res.total_insurance_paid > 0
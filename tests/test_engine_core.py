@@ -1,14 +1,9 @@
 """Tests for the shared Net Value engine core (no-tax invariants)."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 import numpy as np
 import numpy_financial as npf
 
-from simulator.engine import _net_value_series
+from simulator.engine import _find_breakeven, _monthly_payment, _net_value_series
 from simulator.models import SimulationConfig
 
 
@@ -81,6 +76,20 @@ class TestMortgageSchedule:
         # Buyer housing cost is only the payment (all other costs zeroed)
         np.testing.assert_allclose(s["housing_cost_buy"][1:], pmt, atol=1e-6)
 
+    def test_inlined_payment_is_bit_identical_to_npf(self):
+        for loan, rate_annual, term in [
+            (90_000, 6.0, 30),
+            (400_000, 4.5, 25),
+            (1_234_567.89, 0.37, 15),
+            (75_000, 12.25, 40),
+        ]:
+            r = rate_annual / 100 / 12
+            n = term * 12
+            assert _monthly_payment(loan, r, n) == -npf.pmt(r, n, loan)
+
+    def test_payment_at_zero_rate_is_straight_line(self):
+        assert _monthly_payment(90_000, 0.0, 360) == 250.0
+
     def test_balance_closed_form_at_24_months(self):
         cfg = taxfree_config()
         s = run_flat(cfg)
@@ -115,3 +124,26 @@ class TestCashFlowMatching:
         # 0% growth: portfolio = initial capital + accumulated surplus
         expected = 32_400 + 24 * surplus
         assert abs(s["rent_portfolio"][24] - expected) < 1e-4
+
+
+class TestFindBreakeven:
+    years = np.arange(5, dtype=float)
+
+    def breakeven(self, diff: list[float]) -> float | None:
+        return _find_breakeven(self.years, np.array(diff), np.zeros(5))
+
+    def test_crossing_is_linearly_interpolated(self):
+        assert self.breakeven([-3.0, -1.0, 1.0, 2.0, 3.0]) == 1.5
+
+    def test_initial_equality_is_not_a_breakeven(self):
+        assert self.breakeven([0.0, 1.0, 2.0, 3.0, 4.0]) is None
+
+    def test_touching_zero_later_is_a_breakeven(self):
+        assert self.breakeven([-2.0, -1.0, 0.0, -1.0, -2.0]) == 2.0
+
+    def test_first_event_wins(self):
+        # The touch at year 1 precedes the crossing between years 3 and 4
+        assert self.breakeven([-1.0, 0.0, -1.0, -1.0, 1.0]) == 1.0
+
+    def test_no_sign_change_is_none(self):
+        assert self.breakeven([-5.0, -4.0, -3.0, -2.0, -1.0]) is None
@@ -5,10 +5,6 @@ a sign flip or a misplaced /12 fails a build rather than shipping.
 """
 
 import math
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import numpy as np
 
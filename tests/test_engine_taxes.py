@@ -1,10 +1,5 @@
 """Tests for tax primitives: deduction savings + symmetric capital gains."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 import numpy as np
 
 from tests.test_engine_core import run_flat, taxfree_config
@@ -1,10 +1,7 @@
 """Tests for SimulationConfig validation and defaults."""
 
 import math
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from dataclasses import FrozenInstanceError, replace
 
 import pytest
 
@@ -61,6 +58,17 @@ class TestConfigValidation:
         with pytest.raises(ValueError, match="sale_cg_rate_pct"):
             make_config(sale_cg_rate_pct=101)
 
+    def test_config_is_frozen_and_hashable(self):
+        # The API's payload caches key on the config itself
+        cfg = make_config()
+        assert hash(cfg) == hash(make_config())
+        with pytest.raises(FrozenInstanceError):
+            cfg.horizon_years = 20
+
+    def test_replace_revalidates(self):
+        with pytest.raises(ValueError, match="horizon_years"):
+            replace(make_config(), horizon_years=0)
+
 
 class TestMonteCarloDefaults:
     def test_recalibrated_defaults(self):
@@ -1,21 +1,17 @@
 """Tests for Monte Carlo on the shared engine core."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 import itertools
 import math
 from dataclasses import fields as dataclass_fields
 
 import numpy as np
 
-from simulator.engine import calculate_scenarios
+from simulator.engine import _net_value_series, calculate_scenarios
 from simulator.models import MonteCarloConfig, SimulationConfig
 from simulator.monte_carlo import (
     _UI_MINIMUM,
     _compute_sensitivity,
+    _generate_annual_draws,
     run_monte_carlo,
 )
 from tests.test_models import make_config
@@ -24,7 +20,6 @@ from tests.test_us_regression import (
     TORNADO_HIGH,
     TORNADO_LOW,
     TORNADO_NAMES,
-    US_PRESET,
 )
 
 
@@ -50,6 +45,38 @@ class TestSharedCore:
             )
         assert abs(res.median_difference - det.final_difference) < 1e-6
 
+    def test_batched_paths_are_bit_identical_to_one_path_at_a_time(self):
+        # run_monte_carlo pushes whole blocks of paths through the core in
+        # one call; every row must equal the single-path call exactly,
+        # across the tax branches that carry per-path state.
+        cfg = make_config(
+            horizon_years=12,
+            portfolio_deemed_return_pct=6.0,
+            portfolio_drag_rate_pct=36.0,
+            sale_cg_regime="exempt_after_years",
+        )
+        res = run_monte_carlo(cfg, MonteCarloConfig(n_simulations=7, seed=3))
+        draws = _generate_annual_draws(
+            cfg,
+            MonteCarloConfig(n_simulations=7, seed=3),
+            cfg.horizon_years,
+            np.random.default_rng(3),
+        )
+        for i in range(7):
+            series = _net_value_series(
+                cfg,
+                *(
+                    np.repeat(draws[key][i] / 100 / 12, 12)
+                    for key in (
+                        "property_appreciation",
+                        "equity_growth",
+                        "rent_inflation",
+                    )
+                ),
+            )
+            np.testing.assert_array_equal(res.all_net_buy[i], series["net_buy"])
+            np.testing.assert_array_equal(res.all_net_rent[i], series["net_rent"])
+
 
 class TestStatistics:
     def test_shapes_and_ranges(self):
@@ -232,34 +259,25 @@ class TestPortfolioDragIsPathDependent:
 
 
 class TestTornadoLevyDelta:
-    def test_us_tornado_names_and_order_are_preserved(self):
-        sens = _compute_sensitivity(SimulationConfig(**US_PRESET))
-        names = sens.params
-        assert names == TORNADO_NAMES
+    def test_us_tornado_names_and_order_are_preserved(self, us_sensitivity):
+        assert us_sensitivity.params == TORNADO_NAMES
 
-    def test_us_tornado_values_match_within_tolerance(self):
-        sens = _compute_sensitivity(SimulationConfig(**US_PRESET))
-        low = sens.low
-        high = sens.high
-        base = sens.base
-        for actual, golden in zip(low, TORNADO_LOW, strict=True):
+    def test_us_tornado_values_match_within_tolerance(self, us_sensitivity):
+        for actual, golden in zip(us_sensitivity.low, TORNADO_LOW, strict=True):
             assert math.isclose(actual, golden, rel_tol=1e-12)
-        for actual, golden in zip(high, TORNADO_HIGH, strict=True):
+        for actual, golden in zip(us_sensitivity.high, TORNADO_HIGH, strict=True):
             assert math.isclose(actual, golden, rel_tol=1e-12)
-        assert math.isclose(base, TORNADO_BASE, rel_tol=1e-12)
+        assert math.isclose(us_sensitivity.base, TORNADO_BASE, rel_tol=1e-12)
 
-    def test_us_tornado_is_bit_identical(self):
+    def test_us_tornado_is_bit_identical(self, us_sensitivity):
         # 1.2 * (0.5/1.2) is EXACTLY 0.5 in IEEE-754, so low/high are
         # unchanged bit for bit and no ulp allowance is warranted.
         # Asserted so that if a future change does introduce drift,
         # someone decides deliberately rather than inheriting a silent
         # allowance. The test above covers the same goldens at a
         # tolerance; this one is deliberately stricter.
-        sens = _compute_sensitivity(SimulationConfig(**US_PRESET))
-        low = sens.low
-        high = sens.high
-        assert list(low) == TORNADO_LOW
-        assert list(high) == TORNADO_HIGH
+        assert list(us_sensitivity.low) == TORNADO_LOW
+        assert list(us_sensitivity.high) == TORNADO_HIGH
 
     def test_zero_levy_region_drops_the_bar(self):
         # UK/DE/FR ship propertyTaxRate 0.0. A proportional delta at a
@@ -7,12 +7,9 @@ fabricated a plausible but entirely fictitious statute article.
 """
 
 import re
-import sys
 from fractions import Fraction
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from simulator.api import config_from_dict
 from simulator.regions import list_regions
 
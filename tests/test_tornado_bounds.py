@@ -13,12 +13,9 @@ magnitude wider than every other one combined.
 
 import dataclasses
 import re
-import sys
 from fractions import Fraction
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from simulator.api import _camel
 from simulator.engine import calculate_scenarios
 from simulator.models import MonteCarloConfig, SimulationConfig
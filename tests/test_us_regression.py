@@ -12,14 +12,8 @@ regenerated twice, deliberately, when the perturbation rule itself was
 redefined; see the note above them for the standard that applies.
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from simulator.engine import calculate_scenarios
 from simulator.models import SimulationConfig
-from simulator.monte_carlo import _compute_sensitivity
 
 # Mirrors state.js DEFAULT_CONFIG, which is the US bundle applied to the
 # app's shipped defaults. Every field omitted here takes the same value
@@ -132,16 +126,10 @@ class TestUsTornadoUnchanged:
     provably US-inert. The proportional delta is exactly 0.5 at the US
     base of 1.2, so these hold bit-for-bit (plan ambiguity A7)."""
 
-    def test_names_and_order(self):
-        sens = _compute_sensitivity(SimulationConfig(**US_PRESET))
-        names = sens.params
-        assert names == TORNADO_NAMES
+    def test_names_and_order(self, us_sensitivity):
+        assert us_sensitivity.params == TORNADO_NAMES
 
-    def test_values_match_goldens_exactly(self):
-        sens = _compute_sensitivity(SimulationConfig(**US_PRESET))
-        low = sens.low
-        high = sens.high
-        base = sens.base
-        assert list(low) == TORNADO_LOW
-        assert list(high) == TORNADO_HIGH
-        assert base == TORNADO_BASE
+    def test_values_match_goldens_exactly(self, us_sensitivity):
+        assert list(us_sensitivity.low) == TORNADO_LOW
+        assert list(us_sensitivity.high) == TORNADO_HIGH
+        assert us_sensitivity.base == TORNADO_BASE